@@ -0,0 +1,20 @@
+"""
+Application Bootstrap
+Loads environment variables and configures logging exactly once
+"""
+
+import logging
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('job_monitor.log'),
+        logging.StreamHandler()
+    ]
+)
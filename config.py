@@ -1,5 +1,7 @@
 # Configuration file for job searches
 
+import re
+
 # Job search configurations
 # Format: "search_term|location|sources"
 # sources can be: indeed, linkedin (comma-separated)
@@ -40,3 +42,32 @@ EXCLUDED_KEYWORDS = [
     "senior only",
     "10+ years"
 ]
+
+
+def _compile_keywords(keywords):
+    """Compile a keyword list into one case-insensitive alternation"""
+    if not keywords:
+        return None
+    return re.compile(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b', re.IGNORECASE)
+
+
+# Compiled once at import: one C-level scan per job string instead of
+# a Python loop over every keyword
+REQUIRED_RE = _compile_keywords(REQUIRED_KEYWORDS)
+EXCLUDED_RE = _compile_keywords(EXCLUDED_KEYWORDS)
+
+
+def matches_keywords(text: str) -> bool:
+    """Check text against the excluded keyword filter
+
+    Only exclusions drop a job. The required list is a
+    highlight/preference aid (see is_preferred), not a gate: treating
+    it as one silently discards every result from searches it doesn't
+    cover, e.g. "data scientist" against a python-centric list.
+    """
+    return not (EXCLUDED_RE and EXCLUDED_RE.search(text))
+
+
+def is_preferred(text: str) -> bool:
+    """Check whether text mentions any of the required keywords"""
+    return bool(REQUIRED_RE and REQUIRED_RE.search(text))
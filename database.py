@@ -5,105 +5,258 @@ Handles storage and retrieval of job listings using SQLite
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional
 import os
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class JobDatabase:
     """SQLite database manager for job listings"""
-    
+
+    # Columns the notifier and CLI actually consume; avoids SELECT *
+    # materializing unused text and a Row object per result
+    _JOB_COLUMNS = ('job_id', 'title', 'company', 'location', 'url', 'source', 'first_seen')
+    _JOB_SELECT = ', '.join(_JOB_COLUMNS)
+
+    # Current time as integer unix milliseconds. Integer timestamps
+    # compare faster and index smaller than ISO strings; millisecond
+    # resolution keeps the first_seen = last_seen new-row test in
+    # add_job unambiguous.
+    _NOW_MS = "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+    # Hot-path SQL built once; passing the identical string on every
+    # call keeps sqlite3's internal prepared-statement cache hitting
+    _SQL_UPSERT = f'''
+        INSERT INTO jobs (job_id, title, company, location, url, source, search_term)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source, job_id) DO UPDATE
+        SET last_seen = MAX({_NOW_MS}, last_seen + 1)
+    '''
+    _SQL_UPSERT_RETURNING = _SQL_UPSERT + ' RETURNING first_seen = last_seen'
+    _SQL_NEW_JOBS = f'''
+        SELECT {_JOB_SELECT} FROM jobs
+        WHERE is_new = 1
+        ORDER BY first_seen DESC
+    '''
+    _SQL_ALL_JOBS = f'''
+        SELECT {_JOB_SELECT} FROM jobs
+        ORDER BY first_seen DESC
+        LIMIT ?
+    '''
+    _SQL_BY_SEARCH = f'''
+        SELECT {', '.join(f'j.{c}' for c in _JOB_COLUMNS)} FROM jobs_fts f
+        JOIN jobs j ON j.source = f.source AND j.job_id = f.job_id
+        WHERE jobs_fts MATCH ?
+        ORDER BY j.first_seen DESC
+    '''
+
     def __init__(self, db_path: str = "jobs.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self.init_database()
-    
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with performance PRAGMAs applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
+    def vacuum(self):
+        """Compact the database file and refresh planner statistics"""
+        try:
+            with self._lock:
+                self._conn.execute("VACUUM")
+                self._conn.execute("ANALYZE")
+            logger.info("Database vacuumed and analyzed")
+        except Exception as e:
+            logger.error(f"Error vacuuming database: {e}")
+
     def init_database(self):
         """Initialize the database with required tables"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create jobs table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_id TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    company TEXT,
-                    location TEXT,
-                    url TEXT,
-                    source TEXT NOT NULL,
-                    search_term TEXT,
-                    first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_new BOOLEAN DEFAULT 1,
-                    UNIQUE(job_id, source)
-                )
-            ''')
-            
-            # Create search history table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS search_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    search_term TEXT NOT NULL,
-                    location TEXT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    jobs_found INTEGER DEFAULT 0
-                )
-            ''')
-            
-            # Create index for faster queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_job_id_source 
-                ON jobs(job_id, source)
-            ''')
-            
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_is_new 
-                ON jobs(is_new)
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Databases created by the original schema store TEXT
+                # timestamps in a rowid table. CREATE TABLE IF NOT
+                # EXISTS would leave that in place, and TEXT always
+                # compares greater than the integer clock, so cleanup
+                # and timestamp arithmetic silently misbehave. Rename
+                # such tables aside and rebuild + copy below.
+                row = cursor.execute(
+                    "SELECT type FROM pragma_table_info('jobs') WHERE name = 'first_seen'"
+                ).fetchone()
+                legacy_jobs = row is not None and row[0] != 'INTEGER'
+                if legacy_jobs:
+                    logger.info("Migrating jobs table to integer-timestamp schema")
+                    cursor.execute("ALTER TABLE jobs RENAME TO jobs_legacy")
+
+                row = cursor.execute(
+                    "SELECT type FROM pragma_table_info('search_history') WHERE name = 'timestamp'"
+                ).fetchone()
+                legacy_history = row is not None and row[0] != 'INTEGER'
+                if legacy_history:
+                    logger.info("Migrating search_history table to integer-timestamp schema")
+                    cursor.execute("ALTER TABLE search_history RENAME TO search_history_legacy")
+
+                # Create jobs table. The (source, job_id) lookup key is
+                # the primary key itself, so each insert maintains one
+                # B-tree instead of rowid table + unique index.
+                cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        job_id TEXT NOT NULL,
+                        title TEXT NOT NULL,
+                        company TEXT,
+                        location TEXT,
+                        url TEXT,
+                        source TEXT NOT NULL,
+                        search_term TEXT,
+                        first_seen INTEGER DEFAULT ({self._NOW_MS}),
+                        last_seen INTEGER DEFAULT ({self._NOW_MS}),
+                        is_new INTEGER DEFAULT 1,
+                        PRIMARY KEY (source, job_id)
+                    ) WITHOUT ROWID, STRICT
+                ''')
+
+                # Create search history table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS search_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        search_term TEXT NOT NULL,
+                        location TEXT,
+                        timestamp INTEGER DEFAULT (unixepoch()),
+                        jobs_found INTEGER DEFAULT 0
+                    )
+                ''')
+
+                # Partial index: get_new_jobs becomes a single ordered
+                # range scan instead of an index lookup plus filesort
+                cursor.execute("DROP INDEX IF EXISTS idx_is_new")
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_new_first_seen
+                    ON jobs(first_seen DESC) WHERE is_new = 1
+                ''')
+
+                # Covers the ORDER BY first_seen DESC LIMIT ? in get_all_jobs
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_first_seen
+                    ON jobs(first_seen DESC)
+                ''')
+
+                # Full-text index backing get_jobs_by_search, kept in
+                # sync with the jobs table by triggers. jobs has no
+                # rowid, so the FTS table carries its own copy plus the
+                # (source, job_id) key for joining back.
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                        title, company, location, search_term,
+                        source UNINDEXED, job_id UNINDEXED
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                        INSERT INTO jobs_fts(title, company, location, search_term, source, job_id)
+                        VALUES (new.title, new.company, new.location, new.search_term, new.source, new.job_id);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                        DELETE FROM jobs_fts
+                        WHERE source = old.source AND job_id = old.job_id;
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+                    AFTER UPDATE OF title, company, location, search_term ON jobs BEGIN
+                        DELETE FROM jobs_fts
+                        WHERE source = old.source AND job_id = old.job_id;
+                        INSERT INTO jobs_fts(title, company, location, search_term, source, job_id)
+                        VALUES (new.title, new.company, new.location, new.search_term, new.source, new.job_id);
+                    END
+                ''')
+
+                if legacy_jobs:
+                    # Copy rows across, converting the TEXT UTC
+                    # timestamps to unix milliseconds; the insert
+                    # trigger fills jobs_fts as a side effect. Dropping
+                    # the legacy table also drops its indexes.
+                    cursor.execute(f'''
+                        INSERT OR IGNORE INTO jobs
+                            (job_id, title, company, location, url, source,
+                             search_term, first_seen, last_seen, is_new)
+                        SELECT job_id, title, company, location, url, source, search_term,
+                               COALESCE(CAST((julianday(first_seen) - 2440587.5) * 86400000 AS INTEGER), {self._NOW_MS}),
+                               COALESCE(CAST((julianday(last_seen) - 2440587.5) * 86400000 AS INTEGER), {self._NOW_MS}),
+                               CAST(is_new AS INTEGER)
+                        FROM jobs_legacy
+                    ''')
+                    cursor.execute("DROP TABLE jobs_legacy")
+
+                if legacy_history:
+                    cursor.execute('''
+                        INSERT INTO search_history (id, search_term, location, timestamp, jobs_found)
+                        SELECT id, search_term, location,
+                               CAST(strftime('%s', timestamp) AS INTEGER),
+                               jobs_found
+                        FROM search_history_legacy
+                    ''')
+                    cursor.execute("DROP TABLE search_history_legacy")
+
+                # Backfill the full-text index for databases whose rows
+                # predate it (migrated rows arrive via the trigger)
+                needs_backfill = cursor.execute('''
+                    SELECT NOT EXISTS(SELECT 1 FROM jobs_fts)
+                       AND EXISTS(SELECT 1 FROM jobs)
+                ''').fetchone()[0]
+                if needs_backfill:
+                    cursor.execute('''
+                        INSERT INTO jobs_fts(title, company, location, search_term, source, job_id)
+                        SELECT title, company, location, search_term, source, job_id FROM jobs
+                    ''')
+
+                cursor.execute("COMMIT")
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
             raise
-    
+
     def add_job(self, job: Dict) -> bool:
         """
         Add a job to the database or update if it already exists
         Returns True if job is new, False if it already existed
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check if job already exists
-            cursor.execute(
-                "SELECT id FROM jobs WHERE job_id = ? AND source = ?",
-                (job['job_id'], job['source'])
-            )
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update last_seen timestamp
-                cursor.execute(
-                    "UPDATE jobs SET last_seen = CURRENT_TIMESTAMP WHERE id = ?",
-                    (existing[0],)
-                )
-                conn.commit()
-                conn.close()
-                return False
-            else:
-                # Insert new job
-                cursor.execute('''
-                    INSERT INTO jobs (job_id, title, company, location, url, source, search_term)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # One upsert: insert, or refresh last_seen on conflict.
+                # Only a freshly inserted row has first_seen == last_seen;
+                # the conflict branch always moves last_seen forward so
+                # the test can't collide on a coarse clock.
+                cursor.execute(self._SQL_UPSERT_RETURNING, (
                     job['job_id'],
                     job['title'],
                     job.get('company', 'N/A'),
@@ -112,142 +265,158 @@ class JobDatabase:
                     job['source'],
                     job.get('search_term', '')
                 ))
-                conn.commit()
-                conn.close()
+                is_new = bool(cursor.fetchone()[0])
+                cursor.execute("COMMIT")
+
+            if is_new:
                 logger.info(f"Added new job: {job['title']} at {job['company']}")
-                return True
+            return is_new
         except Exception as e:
             logger.error(f"Error adding job to database: {e}")
+            self._rollback()
             return False
-    
+
     def add_jobs_batch(self, jobs: List[Dict]) -> int:
         """
-        Add multiple jobs to database
+        Add multiple jobs to database in a single transaction
         Returns count of new jobs added
         """
-        new_jobs_count = 0
-        for job in jobs:
-            if self.add_job(job):
-                new_jobs_count += 1
-        return new_jobs_count
-    
+        if not jobs:
+            return 0
+
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                rows = (
+                    (
+                        job['job_id'],
+                        job['title'],
+                        job.get('company', 'N/A'),
+                        job.get('location', 'N/A'),
+                        job.get('url', ''),
+                        job['source'],
+                        job.get('search_term', '')
+                    )
+                    for job in jobs
+                )
+
+                cursor.execute("SELECT COUNT(*) FROM jobs")
+                count_before = cursor.fetchone()[0]
+
+                # One upsert statement for the whole batch, committed once
+                cursor.executemany(self._SQL_UPSERT, rows)
+
+                cursor.execute("SELECT COUNT(*) FROM jobs")
+                new_jobs_count = cursor.fetchone()[0] - count_before
+
+                cursor.execute("COMMIT")
+
+                # Keep planner statistics fresh after bulk inserts
+                self._conn.execute("PRAGMA optimize")
+
+            logger.info(f"Added {new_jobs_count} new jobs from batch of {len(jobs)}")
+            return new_jobs_count
+        except Exception as e:
+            logger.error(f"Error adding jobs batch to database: {e}")
+            self._rollback()
+            return 0
+
+    def _rollback(self):
+        """Roll back an open transaction after a failed write"""
+        try:
+            with self._lock:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+        except Exception:
+            pass
+
     def get_new_jobs(self, mark_as_read: bool = False) -> List[Dict]:
         """Get all jobs that haven't been notified yet"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM jobs 
-                WHERE is_new = 1 
-                ORDER BY first_seen DESC
-            ''')
-            
-            rows = cursor.fetchall()
-            jobs = [dict(row) for row in rows]
-            
-            if mark_as_read:
-                cursor.execute("UPDATE jobs SET is_new = 0 WHERE is_new = 1")
-                conn.commit()
-            
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+
+                cursor.execute(self._SQL_NEW_JOBS)
+
+                jobs = [dict(zip(self._JOB_COLUMNS, row)) for row in cursor.fetchall()]
+
+                if mark_as_read:
+                    cursor.execute("UPDATE jobs SET is_new = 0 WHERE is_new = 1")
+
             return jobs
         except Exception as e:
             logger.error(f"Error getting new jobs: {e}")
             return []
-    
+
     def get_all_jobs(self, limit: int = 100) -> List[Dict]:
         """Get all jobs from database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM jobs 
-                ORDER BY first_seen DESC 
-                LIMIT ?
-            ''', (limit,))
-            
-            rows = cursor.fetchall()
-            jobs = [dict(row) for row in rows]
-            
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+
+                cursor.execute(self._SQL_ALL_JOBS, (limit,))
+
+                jobs = [dict(zip(self._JOB_COLUMNS, row)) for row in cursor.fetchall()]
+
             return jobs
         except Exception as e:
             logger.error(f"Error getting jobs: {e}")
             return []
-    
+
     def get_jobs_by_search(self, search_term: str) -> List[Dict]:
-        """Get jobs by search term"""
+        """Get jobs matching a search term via the full-text index"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM jobs 
-                WHERE search_term LIKE ? 
-                ORDER BY first_seen DESC
-            ''', (f'%{search_term}%',))
-            
-            rows = cursor.fetchall()
-            jobs = [dict(row) for row in rows]
-            
-            conn.close()
+            with self._lock:
+                cursor = self._conn.cursor()
+
+                # Quote the term so user input isn't parsed as FTS syntax
+                match = '"' + search_term.replace('"', '""') + '"'
+                cursor.execute(self._SQL_BY_SEARCH, (match,))
+
+                jobs = [dict(zip(self._JOB_COLUMNS, row)) for row in cursor.fetchall()]
+
             return jobs
         except Exception as e:
             logger.error(f"Error getting jobs by search: {e}")
             return []
-    
+
     def log_search(self, search_term: str, location: str, jobs_found: int):
         """Log a search operation"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO search_history (search_term, location, jobs_found)
-                VALUES (?, ?, ?)
-            ''', (search_term, location, jobs_found))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute('''
+                    INSERT INTO search_history (search_term, location, jobs_found)
+                    VALUES (?, ?, ?)
+                ''', (search_term, location, jobs_found))
         except Exception as e:
             logger.error(f"Error logging search: {e}")
-    
+
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Total jobs
-            cursor.execute("SELECT COUNT(*) FROM jobs")
-            total_jobs = cursor.fetchone()[0]
-            
-            # New jobs
-            cursor.execute("SELECT COUNT(*) FROM jobs WHERE is_new = 1")
-            new_jobs = cursor.fetchone()[0]
-            
-            # Jobs by source
-            cursor.execute('''
-                SELECT source, COUNT(*) as count 
-                FROM jobs 
-                GROUP BY source
-            ''')
-            jobs_by_source = dict(cursor.fetchall())
-            
-            # Recent searches
-            cursor.execute('''
-                SELECT COUNT(*) FROM search_history 
-                WHERE timestamp > datetime('now', '-24 hours')
-            ''')
-            searches_today = cursor.fetchone()[0]
-            
-            conn.close()
-            
+            with self._lock:
+                cursor = self._conn.cursor()
+
+                # All scalar counts in one statement
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM jobs),
+                        (SELECT COUNT(*) FROM jobs WHERE is_new = 1),
+                        (SELECT COUNT(*) FROM search_history
+                         WHERE timestamp > unixepoch('now', '-24 hours'))
+                ''')
+                total_jobs, new_jobs, searches_today = cursor.fetchone()
+
+                # Jobs by source
+                cursor.execute('''
+                    SELECT source, COUNT(*) as count
+                    FROM jobs
+                    GROUP BY source
+                ''')
+                jobs_by_source = dict(cursor.fetchall())
+
             return {
                 'total_jobs': total_jobs,
                 'new_jobs': new_jobs,
@@ -257,33 +426,35 @@ class JobDatabase:
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
             return {}
-    
+
     def clear_old_jobs(self, days: int = 30):
         """Remove jobs older than specified days"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                DELETE FROM jobs 
-                WHERE last_seen < datetime('now', '-' || ? || ' days')
-            ''', (days,))
-            
-            deleted = cursor.rowcount
-            conn.commit()
-            conn.close()
-            
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                cursor.execute('''
+                    DELETE FROM jobs
+                    WHERE last_seen < CAST((julianday('now', ?) - 2440587.5) * 86400000 AS INTEGER)
+                ''', (f'-{days} days',))
+
+                deleted = cursor.rowcount
+                cursor.execute("COMMIT")
+                self._conn.execute("PRAGMA optimize")
+
             logger.info(f"Deleted {deleted} old job listings")
             return deleted
         except Exception as e:
             logger.error(f"Error clearing old jobs: {e}")
+            self._rollback()
             return 0
 
 
 if __name__ == "__main__":
     # Test the database
     db = JobDatabase("test_jobs.db")
-    
+
     # Test adding a job
     test_job = {
         'job_id': 'test123',
@@ -294,18 +465,19 @@ if __name__ == "__main__":
         'source': 'Indeed',
         'search_term': 'python developer'
     }
-    
+
     is_new = db.add_job(test_job)
     print(f"Job added (new: {is_new})")
-    
+
     # Get statistics
     stats = db.get_statistics()
     print(f"\nDatabase Statistics:")
     print(f"Total jobs: {stats['total_jobs']}")
     print(f"New jobs: {stats['new_jobs']}")
     print(f"Jobs by source: {stats['jobs_by_source']}")
-    
+
     # Clean up test database
+    db.close()
     if os.path.exists("test_jobs.db"):
         os.remove("test_jobs.db")
         print("\nTest database cleaned up")
@@ -3,30 +3,20 @@ Job Listing Monitor - Main Application
 Coordinates scraping, database storage, and notifications
 """
 
-import schedule
+import app_init  # must come first: loads .env and configures logging
+
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import os
-from dotenv import load_dotenv
 import argparse
 
 from scraper import JobScraperManager
 from database import JobDatabase
 from notifier import NotificationManager
+from config import matches_keywords
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('job_monitor.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -38,10 +28,18 @@ class JobMonitor:
         self.scraper = JobScraperManager()
         self.database = JobDatabase(self.config['db_path'])
         self.notifier = NotificationManager()
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
         
         logger.info("Job Monitor initialized")
         logger.info(f"Monitoring for: {self.config['search_terms']}")
-    
+
+    def __del__(self):
+        try:
+            self.notifier.close()
+        except Exception:
+            pass
+
     def _load_default_config(self) -> dict:
         """Load configuration from environment variables"""
         return {
@@ -53,55 +51,66 @@ class JobMonitor:
             'check_interval': int(os.getenv('CHECK_INTERVAL_MINUTES', 60))
         }
     
+    def _get_statistics(self) -> dict:
+        """Database statistics, cached for 60 seconds between calls"""
+        now = time.monotonic()
+        if self._stats_cache is None or now - self._stats_cached_at > 60:
+            self._stats_cache = self.database.get_statistics()
+            self._stats_cached_at = now
+        return self._stats_cache
+
     def check_for_jobs(self):
         """Main function to check for new job listings"""
         logger.info("=" * 60)
         logger.info(f"Starting job check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("=" * 60)
-        
-        total_new_jobs = 0
-        all_new_jobs = []
-        
-        for search_term in self.config['search_terms']:
-            search_term = search_term.strip()
-            logger.info(f"\nSearching for: '{search_term}'")
-            
-            try:
-                # Scrape jobs
-                jobs = self.scraper.scrape_all_sources(
-                    search_term=search_term,
+
+        search_terms = [term.strip() for term in self.config['search_terms']]
+        collected = []
+
+        # Scraping is network-bound, so fan search terms out across
+        # threads; wall time becomes the slowest term, not the sum
+        with ThreadPoolExecutor(max_workers=max(1, len(search_terms))) as executor:
+            futures = {
+                executor.submit(
+                    self.scraper.scrape_all_sources,
+                    search_term=term,
                     location=self.config['location'],
                     sources=self.config['sources'],
                     max_pages=self.config['max_pages']
-                )
-                
-                logger.info(f"Found {len(jobs)} total jobs for '{search_term}'")
-                
-                # Add jobs to database and count new ones
-                new_count = 0
-                for job in jobs:
-                    if self.database.add_job(job):
-                        new_count += 1
-                        all_new_jobs.append(job)
-                
-                logger.info(f"New jobs for '{search_term}': {new_count}")
-                total_new_jobs += new_count
-                
-                # Log search
-                self.database.log_search(search_term, self.config['location'], len(jobs))
-                
-            except Exception as e:
-                logger.error(f"Error processing search term '{search_term}': {e}")
-        
-        # Send notifications for all new jobs
-        if all_new_jobs:
-            logger.info(f"\n📧 Sending notifications for {total_new_jobs} new job(s)")
-            self.notifier.notify(all_new_jobs)
+                ): term
+                for term in search_terms
+            }
+
+            for future in as_completed(futures):
+                term = futures[future]
+                try:
+                    jobs = future.result()
+                    logger.info(f"Found {len(jobs)} total jobs for '{term}'")
+                    # Drop excluded-keyword titles before storing
+                    collected.extend(
+                        job for job in jobs
+                        if matches_keywords(job['title'])
+                    )
+                    self.database.log_search(term, self.config['location'], len(jobs))
+                except Exception as e:
+                    logger.error(f"Error processing search term '{term}': {e}")
+
+        # One batched write for everything scraped this cycle
+        total_new_jobs = self.database.add_jobs_batch(collected)
+        if total_new_jobs:
+            self._stats_cache = None
+
+        # Notify on everything not yet notified and mark it as read
+        if total_new_jobs:
+            new_jobs = self.database.get_new_jobs(mark_as_read=True)
+            logger.info(f"\n📧 Sending notifications for {len(new_jobs)} new job(s)")
+            self.notifier.notify(new_jobs)
         else:
             logger.info("\nNo new jobs found this time")
         
         # Display statistics
-        stats = self.database.get_statistics()
+        stats = self._get_statistics()
         logger.info(f"\n📊 Database Statistics:")
         logger.info(f"   Total jobs tracked: {stats.get('total_jobs', 0)}")
         logger.info(f"   New jobs (unread): {stats.get('new_jobs', 0)}")
@@ -124,20 +133,23 @@ class JobMonitor:
         
         # Run immediately
         self.check_for_jobs()
-        
-        # Schedule periodic checks
-        schedule.every(interval).minutes.do(self.check_for_jobs)
-        
+
+        # Sleep until the next aligned deadline instead of polling;
+        # advancing next_run by the interval keeps jitter from
+        # accumulating when a check runs long
+        next_run = time.monotonic() + interval * 60
+
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(30)  # Check every 30 seconds
+                time.sleep(max(0, next_run - time.monotonic()))
+                self.check_for_jobs()
+                next_run += interval * 60
         except KeyboardInterrupt:
             logger.info("\nMonitor stopped by user")
     
     def show_statistics(self):
         """Display database statistics"""
-        stats = self.database.get_statistics()
+        stats = self._get_statistics()
         
         print("\n" + "=" * 60)
         print("📊 JOB MONITOR STATISTICS")
@@ -171,7 +183,8 @@ class JobMonitor:
             print(f"   Company: {job['company']}")
             print(f"   Location: {job['location']}")
             print(f"   Source: {job['source']}")
-            print(f"   First seen: {job['first_seen']}")
+            first_seen = datetime.fromtimestamp(job['first_seen'] / 1000)
+            print(f"   First seen: {first_seen.strftime('%Y-%m-%d %H:%M:%S')}")
             if job['url']:
                 print(f"   URL: {job['url']}")
             print()
@@ -182,6 +195,7 @@ class JobMonitor:
         """Remove old job listings"""
         logger.info(f"Cleaning up jobs older than {days} days")
         deleted = self.database.clear_old_jobs(days)
+        self.database.vacuum()
         logger.info(f"Removed {deleted} old job listings")
 
 
@@ -4,19 +4,124 @@ Handles email notifications for new job listings
 """
 
 import smtplib
+import sys
+from html import escape
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict
 import logging
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Static email markup, built once at import instead of per message
+EMAIL_HEADER = """
+<html>
+<head>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }
+        .container {
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        .header {
+            background-color: #4CAF50;
+            color: white;
+            padding: 20px;
+            text-align: center;
+            border-radius: 5px;
+        }
+        .job-card {
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            padding: 15px;
+            margin: 15px 0;
+            background-color: #f9f9f9;
+        }
+        .job-title {
+            font-size: 18px;
+            font-weight: bold;
+            color: #2196F3;
+            margin-bottom: 10px;
+        }
+        .job-details {
+            margin: 5px 0;
+        }
+        .company {
+            font-weight: bold;
+            color: #555;
+        }
+        .location {
+            color: #777;
+        }
+        .source-badge {
+            display: inline-block;
+            padding: 3px 8px;
+            background-color: #2196F3;
+            color: white;
+            border-radius: 3px;
+            font-size: 12px;
+            margin-top: 5px;
+        }
+        .apply-button {
+            display: inline-block;
+            padding: 10px 20px;
+            background-color: #4CAF50;
+            color: white;
+            text-decoration: none;
+            border-radius: 5px;
+            margin-top: 10px;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            color: #777;
+            font-size: 12px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+
+EMAIL_FOOTER = """
+        <div class="footer">
+            <p>This is an automated notification from your Job Listing Monitor</p>
+            <p>Don't miss out on these opportunities!</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+JOB_TMPL = """
+        <div class="job-card">
+            <div class="job-title">{title}</div>
+            <div class="job-details">
+                <span class="company">🏢 {company}</span>
+            </div>
+            <div class="job-details">
+                <span class="location">📍 {location}</span>
+            </div>
+            <span class="source-badge">{source}</span>{link}
+        </div>
+"""
+
+JOB_LINK_TMPL = """
+            <div>
+                <a href="{url}" class="apply-button">View Job →</a>
+            </div>
+"""
+
+
 class EmailNotifier:
     """Send email notifications for new job listings"""
     
@@ -26,13 +131,32 @@ class EmailNotifier:
         self.sender_email = os.getenv('EMAIL_SENDER')
         self.sender_password = os.getenv('EMAIL_PASSWORD')
         self.recipient_email = os.getenv('EMAIL_RECIPIENT')
-        
+        self._smtp = None
+
         if not all([self.sender_email, self.sender_password, self.recipient_email]):
             logger.warning("Email configuration incomplete. Notifications disabled.")
             self.enabled = False
         else:
             self.enabled = True
-    
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return an open, authenticated SMTP session, connecting lazily"""
+        if self._smtp is None:
+            smtp = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            smtp.starttls()
+            smtp.login(self.sender_email, self.sender_password)
+            self._smtp = smtp
+        return self._smtp
+
+    def close(self):
+        """Close the SMTP session if one is open"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
     def send_notification(self, jobs: List[Dict]) -> bool:
         """Send email notification with new job listings"""
         if not self.enabled:
@@ -54,140 +178,53 @@ class EmailNotifier:
             message["From"] = self.sender_email
             message["To"] = self.recipient_email
             
-            # Add HTML content
-            html_part = MIMEText(body, "html")
+            # Add HTML content; declare UTF-8 up front so MIMEText
+            # doesn't attempt an ascii encode first
+            html_part = MIMEText(body, "html", "utf-8")
             message.attach(html_part)
             
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(message)
-            
+            # Send over the persistent session, reconnecting once if the
+            # server dropped the idle connection
+            try:
+                self._get_smtp().send_message(message)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                logger.info("SMTP connection lost, reconnecting")
+                self.close()
+                self._get_smtp().send_message(message)
+
             logger.info(f"Email notification sent successfully to {self.recipient_email}")
             return True
-        
+
         except Exception as e:
             logger.error(f"Failed to send email notification: {e}")
+            self.close()
             return False
     
     def _format_email_body(self, jobs: List[Dict]) -> str:
         """Format jobs list into HTML email body"""
-        html = """
-        <html>
-        <head>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                }
-                .container {
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }
-                .header {
-                    background-color: #4CAF50;
-                    color: white;
-                    padding: 20px;
-                    text-align: center;
-                    border-radius: 5px;
-                }
-                .job-card {
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    padding: 15px;
-                    margin: 15px 0;
-                    background-color: #f9f9f9;
-                }
-                .job-title {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #2196F3;
-                    margin-bottom: 10px;
-                }
-                .job-details {
-                    margin: 5px 0;
-                }
-                .company {
-                    font-weight: bold;
-                    color: #555;
-                }
-                .location {
-                    color: #777;
-                }
-                .source-badge {
-                    display: inline-block;
-                    padding: 3px 8px;
-                    background-color: #2196F3;
-                    color: white;
-                    border-radius: 3px;
-                    font-size: 12px;
-                    margin-top: 5px;
-                }
-                .apply-button {
-                    display: inline-block;
-                    padding: 10px 20px;
-                    background-color: #4CAF50;
-                    color: white;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                }
-                .footer {
-                    text-align: center;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #ddd;
-                    color: #777;
-                    font-size: 12px;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎯 New Job Opportunities!</h1>
-                    <p>Found {count} new job listing{plural} matching your criteria</p>
-                </div>
-        """.format(count=len(jobs), plural='s' if len(jobs) > 1 else '')
-        
+        plural = 's' if len(jobs) > 1 else ''
+        parts = [
+            EMAIL_HEADER,
+            '        <div class="header">\n'
+            '            <h1>🎯 New Job Opportunities!</h1>\n'
+            f'            <p>Found {len(jobs)} new job listing{plural} matching your criteria</p>\n'
+            '        </div>\n'
+        ]
+
         for job in jobs:
-            html += f"""
-                <div class="job-card">
-                    <div class="job-title">{job.get('title', 'N/A')}</div>
-                    <div class="job-details">
-                        <span class="company">🏢 {job.get('company', 'N/A')}</span>
-                    </div>
-                    <div class="job-details">
-                        <span class="location">📍 {job.get('location', 'N/A')}</span>
-                    </div>
-                    <span class="source-badge">{job.get('source', 'N/A')}</span>
-            """
-            
-            if job.get('url'):
-                html += f"""
-                    <div>
-                        <a href="{job['url']}" class="apply-button">View Job →</a>
-                    </div>
-                """
-            
-            html += """
-                </div>
-            """
-        
-        html += """
-                <div class="footer">
-                    <p>This is an automated notification from your Job Listing Monitor</p>
-                    <p>Don't miss out on these opportunities!</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+            # Scraped fields are untrusted; escape them so they can't
+            # break the markup
+            url = job.get('url')
+            parts.append(JOB_TMPL.format(
+                title=escape(job.get('title', 'N/A'), quote=True),
+                company=escape(job.get('company', 'N/A'), quote=True),
+                location=escape(job.get('location', 'N/A'), quote=True),
+                source=escape(job.get('source', 'N/A'), quote=True),
+                link=JOB_LINK_TMPL.format(url=escape(url, quote=True)) if url else ''
+            ))
+
+        parts.append(EMAIL_FOOTER)
+        return ''.join(parts)
     
     def send_test_email(self) -> bool:
         """Send a test email to verify configuration"""
@@ -215,20 +252,27 @@ class ConsoleNotifier:
             logger.info("No new jobs to notify")
             return False
         
-        print("\n" + "="*70)
-        print(f"🔔 NEW JOB LISTINGS FOUND: {len(jobs)}")
-        print("="*70 + "\n")
-        
+        # Build the whole report and emit it with one write instead of
+        # several print calls per job
+        parts = [
+            "\n" + "="*70,
+            f"🔔 NEW JOB LISTINGS FOUND: {len(jobs)}",
+            "="*70 + "\n"
+        ]
+
         for i, job in enumerate(jobs, 1):
-            print(f"{i}. {job.get('title', 'N/A')}")
-            print(f"   Company: {job.get('company', 'N/A')}")
-            print(f"   Location: {job.get('location', 'N/A')}")
-            print(f"   Source: {job.get('source', 'N/A')}")
+            parts.append(
+                f"{i}. {job.get('title', 'N/A')}\n"
+                f"   Company: {job.get('company', 'N/A')}\n"
+                f"   Location: {job.get('location', 'N/A')}\n"
+                f"   Source: {job.get('source', 'N/A')}"
+            )
             if job.get('url'):
-                print(f"   URL: {job['url']}")
-            print()
-        
-        print("="*70 + "\n")
+                parts.append(f"   URL: {job['url']}")
+            parts.append("")
+
+        parts.append("="*70 + "\n")
+        sys.stdout.write("\n".join(parts) + "\n")
         return True
 
 
@@ -259,6 +303,10 @@ class NotificationManager:
         """Test email configuration"""
         return self.email_notifier.send_test_email()
 
+    def close(self):
+        """Release notifier resources"""
+        self.email_notifier.close()
+
 
 if __name__ == "__main__":
     # Test notifications
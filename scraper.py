@@ -3,22 +3,338 @@ Job Scraper Module
 Scrapes job listings from various job boards
 """
 
+import asyncio
+import atexit
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from aiohttp_client_cache import CachedSession as AiohttpCachedSession
+    from aiohttp_client_cache import SQLiteBackend as AiohttpSQLiteBackend
+except ImportError:
+    AiohttpCachedSession = None
+    AiohttpSQLiteBackend = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import joblib
+except ImportError:
+    joblib = None
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
 from typing import List, Dict
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Disk-backed memo store for page-level scrape results, keyed by the
+# cached function's arguments
+_memory = joblib.Memory('.job_cache', verbose=0) if joblib is not None else None
+
+
+@dataclass(slots=True, frozen=True)
+class Job:
+    """One scraped job listing
+
+    Slotted and frozen: instances carry no per-object __dict__ and are
+    hashable, so large result sets stay compact and dedup directly in
+    sets and dicts. Dict-style access (job['title'], job.get('url'))
+    is kept so downstream consumers written against dict rows still
+    work unchanged.
+    """
+    title: str
+    company: str
+    location: str
+    url: str
+    source: str
+    job_id: str
+    search_term: str
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        """Dict-style lookup with a default"""
+        return getattr(self, key, default)
+
+    def asdict(self) -> Dict:
+        """Plain-dict view, e.g. for JSON serialization"""
+        return asdict(self)
+
+
+@dataclass
+class JobBatch:
+    """Columnar batch of scraped jobs from one source
+
+    Struct-of-arrays layout: N jobs cost five lists of strings rather
+    than N seven-key dicts, and the per-batch scalars (source,
+    search_term) are stored once instead of once per job. Scrapers
+    accumulate into batches; to_records() materializes row dicts at
+    the boundary for downstream consumers.
+    """
+    source: str
+    search_term: str
+    titles: List[str] = field(default_factory=list)
+    companies: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    job_ids: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def append(self, title: str, company: str, location: str, url: str, job_id: str):
+        """Add one job to the batch"""
+        self.titles.append(title)
+        self.companies.append(company)
+        self.locations.append(location)
+        self.urls.append(url)
+        self.job_ids.append(job_id)
+
+    def extend(self, other: 'JobBatch'):
+        """Concatenate another batch column-wise"""
+        self.titles.extend(other.titles)
+        self.companies.extend(other.companies)
+        self.locations.extend(other.locations)
+        self.urls.extend(other.urls)
+        self.job_ids.extend(other.job_ids)
+
+    def to_records(self) -> List[Job]:
+        """Materialize Job rows for downstream consumers"""
+        return [
+            Job(
+                title=title,
+                company=company,
+                location=location,
+                url=url,
+                source=self.source,
+                job_id=job_id,
+                search_term=self.search_term
+            )
+            for title, company, location, url, job_id in zip(
+                self.titles, self.companies, self.locations, self.urls, self.job_ids
+            )
+        ]
+
+
+# Shared process pool for CPU-bound HTML parsing, started on first use
+# so importing this module never spawns workers
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared parse pool, starting it on first use
+
+    Creation is locked because concurrent search-term threads can hit
+    first use together, and spawn is used instead of the default fork:
+    by the time the pool starts this process is multi-threaded, and
+    forking a threaded process can deadlock the children on inherited
+    locks.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
+
+
+def _parse_indeed(html, search_term: str) -> JobBatch:
+    """Extract a job batch from one page of Indeed search results
+
+    Module-level (and so picklable) because it runs in the parse pool's
+    worker processes.
+    """
+    batch = JobBatch('Indeed', search_term)
+    soup = BeautifulSoup(html, 'lxml')
+    job_cards = soup.find_all('div', class_=_INDEED_CARD_CLASS)
+
+    for card in job_cards:
+        try:
+            title_elem = card.find('h2', class_=_INDEED_TITLE_CLASS)
+            company_elem = card.find('span', _INDEED_COMPANY_ATTRS)
+            location_elem = card.find('div', _INDEED_LOCATION_ATTRS)
+
+            if title_elem:
+                job_link = title_elem.find('a')
+                title = title_elem.get_text(strip=True)
+                job_id = job_link.get('data-jk', '') if job_link else ''
+                job_url = f"{_INDEED_BASE_URL}/viewjob?jk={job_id}" if job_id else ""
+
+                batch.append(
+                    title=title,
+                    company=company_elem.get_text(strip=True) if company_elem else "N/A",
+                    location=location_elem.get_text(strip=True) if location_elem else "N/A",
+                    url=job_url,
+                    job_id=job_id
+                )
+        except Exception as e:
+            logger.error(f"Error parsing job card: {e}")
+            continue
+
+    return batch
+
+
+def _parse_indeed_stream(chunks, search_term: str) -> JobBatch:
+    """Extract a job batch from an Indeed page while it downloads
+
+    SAX-style counterpart of _parse_indeed: byte chunks feed an
+    HTMLPullParser as they arrive, each completed job card is reduced
+    to its fields and freed, so the full page body is never held in
+    memory at once.
+    """
+    batch = JobBatch('Indeed', search_term)
+    parser = etree.HTMLPullParser(events=('end',))
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag != 'div' or _INDEED_CARD_CLASS not in (elem.get('class') or ''):
+                continue
+            try:
+                title_elems = elem.xpath(f'.//h2[contains(@class, "{_INDEED_TITLE_CLASS}")]')
+                if title_elems:
+                    title_elem = title_elems[0]
+                    job_links = title_elem.xpath('.//a[@data-jk]')
+                    job_id = job_links[0].get('data-jk', '') if job_links else ''
+                    job_url = f"{_INDEED_BASE_URL}/viewjob?jk={job_id}" if job_id else ""
+                    companies = elem.xpath('.//span[@data-testid="company-name"]')
+                    locations = elem.xpath('.//div[@data-testid="text-location"]')
+
+                    batch.append(
+                        title=''.join(title_elem.itertext()).strip(),
+                        company=''.join(companies[0].itertext()).strip() if companies else "N/A",
+                        location=''.join(locations[0].itertext()).strip() if locations else "N/A",
+                        url=job_url,
+                        job_id=job_id
+                    )
+            except Exception as e:
+                logger.error(f"Error parsing job card: {e}")
+            finally:
+                elem.clear()  # drop the parsed subtree; only the fields survive
+
+    return batch
+
+
+# Indeed card selectors, built once instead of re-creating class
+# strings and attribute dicts on every card in the parse loop
+_INDEED_BASE_URL = 'https://www.indeed.com'
+_INDEED_CARD_CLASS = 'job_seen_beacon'
+_INDEED_TITLE_CLASS = 'jobTitle'
+_INDEED_COMPANY_ATTRS = {'data-testid': 'company-name'}
+_INDEED_LOCATION_ATTRS = {'data-testid': 'text-location'}
+
+# Runs inside the browser: one WebDriver round-trip returns all job
+# cards as plain dicts
+_LINKEDIN_EXTRACT_JS = """
+return Array.from(document.querySelectorAll('div.base-card')).map(c => ({
+    title: c.querySelector('h3.base-search-card__title')?.innerText?.trim(),
+    company: c.querySelector('h4.base-search-card__subtitle')?.innerText?.trim(),
+    location: c.querySelector('span.job-search-card__location')?.innerText?.trim(),
+    url: c.querySelector('a.base-card__full-link')?.href
+}));
+"""
+
+_LINKEDIN_COUNT_JS = "return document.querySelectorAll('div.base-card').length;"
+
+# Analytics/ads domains and asset types the scraper never needs;
+# first-party scripts stay unblocked since the jobs page needs them
+_CDP_BLOCKED_URLS = [
+    '*doubleclick.net*',
+    '*googlesyndication*',
+    '*google-analytics*',
+    '*linkedin.com/li/track*',
+    '*px.ads.linkedin.com*',
+    '*.woff', '*.woff2',
+    '*.png', '*.jpg', '*.gif', '*.svg',
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process
+
+    ChromeDriverManager().install() does a version check (and possibly
+    a download) every call; caching the resolved path keeps that I/O
+    out of browser restarts.
+    """
+    return ChromeDriverManager().install()
+
+
+# Statuses worth retrying: rate limits and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def _fetch_with_retry(session, url: str, semaphore, attempts: int = 4) -> tuple:
+    """GET a URL with exponential backoff, returning (status, body)
+
+    Transient failures (connection errors, timeouts, 429/5xx) retry up
+    to `attempts` times, sleeping 0.5 * 2^n seconds capped at 8. The
+    semaphore bounds concurrency across retries too, so backing off
+    never stampedes the server.
+    """
+    delay = 0.5
+    async with semaphore:
+        for attempt in range(1, attempts + 1):
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status not in _RETRY_STATUSES or attempt == attempts:
+                        if response.status != 200:
+                            return response.status, ""
+                        return response.status, await response.text()
+                    logger.warning(
+                        f"Got status {response.status} for {url}, "
+                        f"retrying (attempt {attempt}/{attempts})"
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == attempts:
+                    raise
+                logger.warning(f"Error fetching {url}: {e}, retrying (attempt {attempt}/{attempts})")
+            await asyncio.sleep(min(delay, 8))
+            delay *= 2
+
+
+def _install_cdp_blocks(driver):
+    """Block tracker and asset requests at the network layer"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _CDP_BLOCKED_URLS})
+    except Exception as e:
+        logger.warning(f"Could not install CDP network blocks: {e}")
+
 
 class JobScraper:
     """Base class for job scraping"""
@@ -28,7 +344,7 @@ class JobScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
     
-    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 5) -> List[Dict]:
+    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 5) -> JobBatch:
         """Override this method in subclasses"""
         raise NotImplementedError
 
@@ -36,148 +352,436 @@ class JobScraper:
 class IndeedScraper(JobScraper):
     """Scraper for Indeed.com"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl: int = 1800):
         super().__init__()
-        self.base_url = "https://www.indeed.com"
-    
-    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 5) -> List[Dict]:
-        """Scrape jobs from Indeed"""
-        jobs = []
-        
+        self.base_url = _INDEED_BASE_URL
+        self.cache_ttl = cache_ttl
+
+        # Keep-alive session: pages after the first reuse a warm
+        # socket instead of paying TCP+TLS setup again. With
+        # requests-cache installed, repeat fetches of the same URL
+        # within cache_ttl skip the network entirely (cache_ttl=0
+        # disables caching).
+        if requests_cache is not None and cache_ttl:
+            self.session = requests_cache.CachedSession(
+                'indeed_cache',
+                backend='sqlite',
+                expire_after=cache_ttl,
+                allowable_codes=(200,)
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=4,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Memoize page scrapes on disk. Wrap the bound method here
+        # rather than decorating at class level: joblib's cache wrapper
+        # is not a descriptor, so a class-level wrapper would never
+        # receive self.
+        if _memory is not None:
+            self._fetch_and_parse_page = _memory.cache(
+                self._fetch_and_parse_page, ignore=['self']
+            )
+
+    def close(self):
+        """Release the HTTP session"""
+        self.session.close()
+
+    def _page_url(self, search_term: str, location: str, page: int) -> str:
+        """Build the search URL for one result page"""
+        start = page * 10
+        return (
+            f"{self.base_url}/jobs?q={search_term.replace(' ', '+')}"
+            f"&l={location.replace(' ', '+')}&start={start}"
+        )
+
+    async def _fetch(self, session, url: str, semaphore) -> str:
+        """Fetch one page, bounded by the politeness semaphore
+
+        Never raises: a page whose retries are exhausted yields an
+        empty body, so one bad page can't abort the gather for the
+        rest.
+        """
         try:
-            for page in range(max_pages):
-                start = page * 10
-                url = f"{self.base_url}/jobs?q={search_term.replace(' ', '+')}&l={location.replace(' ', '+')}&start={start}"
-                
-                logger.info(f"Scraping Indeed page {page + 1}: {url}")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                
-                if response.status_code != 200:
-                    logger.warning(f"Failed to fetch page {page + 1}, status: {response.status_code}")
-                    continue
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
-                
-                if not job_cards:
-                    logger.info("No more jobs found")
-                    break
-                
-                for card in job_cards:
-                    try:
-                        title_elem = card.find('h2', class_='jobTitle')
-                        company_elem = card.find('span', {'data-testid': 'company-name'})
-                        location_elem = card.find('div', {'data-testid': 'text-location'})
-                        
-                        if title_elem:
-                            job_link = title_elem.find('a')
-                            title = title_elem.get_text(strip=True)
-                            job_id = job_link.get('data-jk', '') if job_link else ''
-                            job_url = f"{self.base_url}/viewjob?jk={job_id}" if job_id else ""
-                            
-                            job = {
-                                'title': title,
-                                'company': company_elem.get_text(strip=True) if company_elem else "N/A",
-                                'location': location_elem.get_text(strip=True) if location_elem else "N/A",
-                                'url': job_url,
-                                'source': 'Indeed',
-                                'job_id': job_id,
-                                'search_term': search_term
-                            }
-                            jobs.append(job)
-                    except Exception as e:
-                        logger.error(f"Error parsing job card: {e}")
-                        continue
-                
-                time.sleep(2)  # Be respectful to the server
-        
+            status, body = await _fetch_with_retry(session, url, semaphore)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Giving up on {url}: {e}")
+            return ""
+        if status != 200:
+            logger.warning(f"Failed to fetch {url}, status: {status}")
+        return body
+
+    async def scrape_jobs_async(self, search_term: str, location: str = "", max_pages: int = 5) -> JobBatch:
+        """Scrape jobs from Indeed, fetching all pages concurrently"""
+        jobs = JobBatch('Indeed', search_term)
+
+        try:
+            urls = [self._page_url(search_term, location, page) for page in range(max_pages)]
+            semaphore = asyncio.Semaphore(5)
+
+            logger.info(f"Scraping {len(urls)} Indeed pages concurrently")
+            # Cached counterpart of the requests-cache session: repeat
+            # fetches of the same URL within cache_ttl skip the network
+            # on the async path too
+            if AiohttpCachedSession is not None and self.cache_ttl:
+                session_cm = AiohttpCachedSession(
+                    cache=AiohttpSQLiteBackend(
+                        'indeed_cache_async',
+                        expire_after=self.cache_ttl,
+                        allowed_codes=(200,)
+                    ),
+                    headers=self.headers,
+                    connector=aiohttp.TCPConnector(limit=10)
+                )
+            else:
+                session_cm = aiohttp.ClientSession(
+                    headers=self.headers,
+                    connector=aiohttp.TCPConnector(limit=10)
+                )
+            async with session_cm as session:
+                pages = await asyncio.gather(
+                    *(self._fetch(session, url, semaphore) for url in urls)
+                )
+
+            # Parsing is CPU-bound; farm it out to worker processes so
+            # it scales with cores instead of blocking the event loop
+            loop = asyncio.get_running_loop()
+            pool = _get_parse_pool()
+            parsed = await asyncio.gather(*(
+                loop.run_in_executor(pool, _parse_indeed, html, search_term)
+                for html in pages if html
+            ))
+            for page_batch in parsed:
+                jobs.extend(page_batch)
+
         except Exception as e:
             logger.error(f"Error scraping Indeed: {e}")
-        
+
+        logger.info(f"Found {len(jobs)} jobs on Indeed")
+        return jobs
+
+    def _fetch_and_parse_page(self, page: int, search_term: str, location: str,
+                              cache_day: str = '') -> JobBatch:
+        """Fetch and parse one result page over the shared session
+
+        cache_day takes part in the memo key, so passing today's date
+        invalidates cached results daily.
+        """
+        url = self._page_url(search_term, location, page)
+
+        logger.info(f"Scraping Indeed page {page + 1}: {url}")
+        # Stream the body and parse it as it downloads, so the peak is
+        # one 16 KiB chunk plus the current card rather than the whole
+        # page body and its DOM side by side
+        with self.session.get(url, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch page {page + 1}, status: {response.status_code}")
+                return JobBatch('Indeed', search_term)
+
+            return _parse_indeed_stream(
+                response.iter_content(chunk_size=16384), search_term
+            )
+
+    def _scrape_jobs_sync(self, search_term: str, location: str = "", max_pages: int = 5) -> JobBatch:
+        """Threaded fallback used when aiohttp is not installed"""
+        jobs = JobBatch('Indeed', search_term)
+
+        # Pages are independent, so fetch them on threads; the session's
+        # connection pool is sized to hold a socket per worker
+        with ThreadPoolExecutor(max_workers=min(max_pages, 5)) as executor:
+            futures = [
+                executor.submit(self._fetch_and_parse_page, page, search_term, location,
+                                cache_day=date.today().isoformat())
+                for page in range(max_pages)
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    jobs.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error scraping Indeed: {e}")
+
         logger.info(f"Found {len(jobs)} jobs on Indeed")
         return jobs
 
+    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 5) -> JobBatch:
+        """Scrape jobs from Indeed"""
+        if aiohttp is None:
+            return self._scrape_jobs_sync(search_term, location, max_pages)
+        return asyncio.run(self.scrape_jobs_async(search_term, location, max_pages))
+
 
 class LinkedInScraper(JobScraper):
     """Scraper for LinkedIn (requires Selenium due to dynamic content)"""
-    
+
+    # Restart the browser periodically so a long-lived session can't
+    # leak memory indefinitely
+    RESTART_EVERY_N_PAGES = 20
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.linkedin.com"
-    
+        self._driver = None
+        self._pages_since_restart = 0
+        # One browser is shared across calls, and the manager runs
+        # search terms concurrently against the same instance, so all
+        # driver use is serialized. Reentrant because the error path
+        # in scrape_jobs calls close() while holding the lock.
+        self._driver_lock = threading.RLock()
+        atexit.register(self.close)
+
+    def close(self):
+        """Quit the cached browser, if any"""
+        with self._driver_lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                except Exception:
+                    pass
+                self._driver = None
+                self._pages_since_restart = 0
+
+    def _driver_alive(self) -> bool:
+        """Check whether the cached driver's service is still up"""
+        try:
+            return self._driver.service.is_connectable()
+        except Exception:
+            return False
+
     def _setup_driver(self):
-        """Setup Chrome driver with headless option"""
+        """Return the cached Chrome driver, starting one if needed"""
+        if self._driver is not None and self._driver_alive():
+            return self._driver
+
+        self.close()
+
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument(f'user-agent={self.headers["User-Agent"]}')
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        return driver
-    
-    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 3) -> List[Dict]:
+
+        # The scraper only reads text out of the DOM, so skip
+        # downloading and rendering assets it never looks at
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--window-size=1280,800')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.plugins': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+
+        service = Service(_chromedriver_path())
+        self._driver = webdriver.Chrome(service=service, options=chrome_options)
+        _install_cdp_blocks(self._driver)
+        return self._driver
+
+
+    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 3) -> JobBatch:
         """Scrape jobs from LinkedIn"""
-        jobs = []
-        driver = None
-        
+        jobs = JobBatch('LinkedIn', search_term)
+
         try:
-            driver = self._setup_driver()
-            
-            for page in range(max_pages):
-                start = page * 25
-                url = f"{self.base_url}/jobs/search/?keywords={search_term.replace(' ', '%20')}&location={location.replace(' ', '%20')}&start={start}"
-                
-                logger.info(f"Scraping LinkedIn page {page + 1}")
-                driver.get(url)
-                time.sleep(3)  # Wait for page to load
-                
-                # Scroll to load more jobs
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                job_cards = soup.find_all('div', class_='base-card')
-                
-                if not job_cards:
-                    logger.info("No more jobs found on LinkedIn")
-                    break
-                
-                for card in job_cards:
+            with self._driver_lock:
+                for page in range(max_pages):
+                    # Recycle the browser periodically; otherwise reuse it
+                    # across pages and across scrape_jobs calls
+                    if self._pages_since_restart >= self.RESTART_EVERY_N_PAGES:
+                        logger.info("Restarting LinkedIn browser session")
+                        self.close()
+                    driver = self._setup_driver()
+                    self._pages_since_restart += 1
+
+                    start = page * 25
+                    url = f"{self.base_url}/jobs/search/?keywords={search_term.replace(' ', '%20')}&location={location.replace(' ', '%20')}&start={start}"
+
+                    logger.info(f"Scraping LinkedIn page {page + 1}")
+                    driver.get(url)
+
+                    # Wait for cards instead of sleeping a fixed 3 seconds
                     try:
-                        title_elem = card.find('h3', class_='base-search-card__title')
-                        company_elem = card.find('h4', class_='base-search-card__subtitle')
-                        location_elem = card.find('span', class_='job-search-card__location')
-                        link_elem = card.find('a', class_='base-card__full-link')
-                        
-                        if title_elem and link_elem:
-                            job_url = link_elem.get('href', '')
-                            job_id = job_url.split('/')[-1].split('?')[0] if job_url else ''
-                            
-                            job = {
-                                'title': title_elem.get_text(strip=True),
-                                'company': company_elem.get_text(strip=True) if company_elem else "N/A",
-                                'location': location_elem.get_text(strip=True) if location_elem else "N/A",
-                                'url': job_url,
-                                'source': 'LinkedIn',
-                                'job_id': job_id,
-                                'search_term': search_term
-                            }
-                            jobs.append(job)
-                    except Exception as e:
-                        logger.error(f"Error parsing LinkedIn job card: {e}")
-                        continue
-                
-                time.sleep(3)  # Be respectful to the server
-        
+                        WebDriverWait(driver, 10).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, 'div.base-card'))
+                        )
+                    except TimeoutException:
+                        logger.info("No job cards appeared on LinkedIn page")
+                        break
+
+                    card_count = driver.execute_script(_LINKEDIN_COUNT_JS)
+
+                    # Scroll to load more jobs, returning as soon as new
+                    # cards are attached (or the short wait expires)
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    try:
+                        WebDriverWait(driver, 5).until(
+                            lambda d: d.execute_script(_LINKEDIN_COUNT_JS) > card_count
+                        )
+                    except TimeoutException:
+                        pass  # nothing more loaded
+
+                    # Extract all cards in the browser with one script call,
+                    # instead of shipping the whole DOM over the WebDriver
+                    # wire and re-parsing it in Python
+                    job_cards = driver.execute_script(_LINKEDIN_EXTRACT_JS)
+
+                    if not job_cards:
+                        logger.info("No more jobs found on LinkedIn")
+                        break
+
+                    for card in job_cards:
+                        try:
+                            job_url = card.get('url') or ''
+                            if not card.get('title') or not job_url:
+                                continue
+                            job_id = job_url.split('/')[-1].split('?')[0]
+
+                            jobs.append(
+                                title=card['title'],
+                                company=card.get('company') or "N/A",
+                                location=card.get('location') or "N/A",
+                                url=job_url,
+                                job_id=job_id
+                            )
+                        except Exception as e:
+                            logger.error(f"Error parsing LinkedIn job card: {e}")
+                            continue
+
+                    time.sleep(3)  # Be respectful to the server
+
         except Exception as e:
             logger.error(f"Error scraping LinkedIn: {e}")
-        finally:
-            if driver:
-                driver.quit()
-        
+            self.close()  # don't reuse a browser in an unknown state
+
+        logger.info(f"Found {len(jobs)} jobs on LinkedIn")
+        return jobs
+
+
+class LinkedInAsyncScraper(JobScraper):
+    """Scraper for LinkedIn's guest jobs endpoint (no browser needed)
+
+    The public jobs search exposes the same card markup through
+    /jobs-guest/jobs/api/seeMoreJobPostings/search without executing
+    any JavaScript, so pages can be fetched concurrently like Indeed's.
+    Falls back to the Selenium scraper when LinkedIn refuses guest
+    traffic or aiohttp is not installed.
+    """
+
+    GUEST_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://www.linkedin.com"
+        self._fallback = LinkedInScraper()  # no browser until first used
+
+    def close(self):
+        """Release fallback scraper resources"""
+        self._fallback.close()
+
+    def _page_url(self, search_term: str, location: str, page: int) -> str:
+        """Build the guest endpoint URL for one result page"""
+        return (
+            f"{self.GUEST_URL}?keywords={search_term.replace(' ', '%20')}"
+            f"&location={location.replace(' ', '%20')}&start={page * 25}"
+        )
+
+    def _parse_fragment(self, html: str, search_term: str) -> JobBatch:
+        """Extract a job batch from one guest-endpoint HTML fragment"""
+        batch = JobBatch('LinkedIn', search_term)
+        soup = BeautifulSoup(html, 'lxml')
+
+        for card in soup.find_all('div', class_='base-card'):
+            try:
+                title_elem = card.find('h3', class_='base-search-card__title')
+                link_elem = card.find('a', class_='base-card__full-link')
+                job_url = link_elem.get('href', '') if link_elem else ''
+                if not title_elem or not job_url:
+                    continue
+
+                company_elem = card.find('h4', class_='base-search-card__subtitle')
+                location_elem = card.find('span', class_='job-search-card__location')
+                job_id = job_url.split('/')[-1].split('?')[0]
+
+                batch.append(
+                    title=title_elem.get_text(strip=True),
+                    company=company_elem.get_text(strip=True) if company_elem else "N/A",
+                    location=location_elem.get_text(strip=True) if location_elem else "N/A",
+                    url=job_url,
+                    job_id=job_id
+                )
+            except Exception as e:
+                logger.error(f"Error parsing LinkedIn job card: {e}")
+                continue
+
+        return batch
+
+    async def _fetch(self, session, url: str, semaphore) -> tuple:
+        """Fetch one fragment, returning (status, body)
+
+        Never raises: exhausted retries yield (0, "") so the other
+        pages in the gather still land (status 0 is not a 4xx, so it
+        also doesn't force the Selenium fallback on its own).
+        """
+        try:
+            return await _fetch_with_retry(session, url, semaphore)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Giving up on {url}: {e}")
+            return 0, ""
+
+    async def _scrape_async(self, search_term: str, location: str, max_pages: int):
+        """Fetch all pages concurrently; None means the endpoint refused us"""
+        urls = [self._page_url(search_term, location, page) for page in range(max_pages)]
+        semaphore = asyncio.Semaphore(5)
+
+        logger.info(f"Scraping {len(urls)} LinkedIn guest pages concurrently")
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=10)
+        ) as session:
+            pages = await asyncio.gather(
+                *(self._fetch(session, url, semaphore) for url in urls)
+            )
+
+        jobs = JobBatch('LinkedIn', search_term)
+        for status, html in pages:
+            if 400 <= status < 500:
+                logger.warning(f"LinkedIn guest endpoint refused request, status: {status}")
+                return None
+            if html:
+                jobs.extend(self._parse_fragment(html, search_term))
+        return jobs
+
+    def scrape_jobs(self, search_term: str, location: str = "", max_pages: int = 3) -> JobBatch:
+        """Scrape jobs from LinkedIn, preferring the guest endpoint"""
+        jobs = None
+        if aiohttp is not None:
+            try:
+                jobs = asyncio.run(self._scrape_async(search_term, location, max_pages))
+            except Exception as e:
+                logger.error(f"Error scraping LinkedIn guest endpoint: {e}")
+
+        if jobs is None:
+            logger.info("Falling back to Selenium for LinkedIn")
+            return self._fallback.scrape_jobs(search_term, location, max_pages)
+
         logger.info(f"Found {len(jobs)} jobs on LinkedIn")
         return jobs
 
@@ -188,31 +792,63 @@ class JobScraperManager:
     def __init__(self):
         self.scrapers = {
             'indeed': IndeedScraper(),
-            'linkedin': LinkedInScraper()
+            'linkedin': LinkedInAsyncScraper()
         }
     
-    def scrape_all_sources(self, search_term: str, location: str = "", 
+    def scrape_all_sources(self, search_term: str, location: str = "",
                           sources: List[str] = None, max_pages: int = 5) -> List[Dict]:
-        """Scrape jobs from all specified sources"""
+        """Scrape jobs from all specified sources in parallel"""
         if sources is None:
             sources = list(self.scrapers.keys())
-        
-        all_jobs = []
-        
+
+        valid_sources = []
         for source in sources:
             if source in self.scrapers:
-                logger.info(f"Starting scrape from {source}")
-                try:
-                    jobs = self.scrapers[source].scrape_jobs(search_term, location, max_pages)
-                    all_jobs.extend(jobs)
-                except Exception as e:
-                    logger.error(f"Failed to scrape {source}: {e}")
+                valid_sources.append(source)
             else:
                 logger.warning(f"Unknown source: {source}")
-        
+
+        # Dedup as batches land: Indeed repeats listings across pages
+        # when its paging shifts. Jobs stay columnar until this
+        # boundary; row dicts are materialized once per unique job for
+        # downstream consumers. A dict keeps insertion order and O(1)
+        # lookups; jobs without a job_id fall back to a content
+        # fingerprint so they can still collapse.
+        unique_jobs = {}
+
+        if valid_sources:
+            # Every scraper is I/O-bound, so run them on threads and
+            # pay only for the slowest source instead of the sum
+            with ThreadPoolExecutor(max_workers=len(valid_sources)) as executor:
+                futures = {}
+                for source in valid_sources:
+                    logger.info(f"Starting scrape from {source}")
+                    futures[executor.submit(
+                        self.scrapers[source].scrape_jobs,
+                        search_term, location, max_pages
+                    )] = source
+
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        for job in future.result().to_records():
+                            key = (
+                                (job['source'], job['job_id']) if job['job_id']
+                                else hash((job['title'], job['company'], job['location']))
+                            )
+                            unique_jobs.setdefault(key, job)
+                    except Exception as e:
+                        logger.error(f"Failed to scrape {source}: {e}")
+
+        all_jobs = list(unique_jobs.values())
         logger.info(f"Total jobs scraped: {len(all_jobs)}")
         return all_jobs
 
+    def clear_cache(self):
+        """Drop all memoized page results from disk"""
+        if _memory is not None:
+            _memory.clear(warn=False)
+
 
 if __name__ == "__main__":
     # Test the scraper